@@ -19,9 +19,11 @@ import pygame
 import sys
 import os
 import math
-import copy
 import random
 import bisect
+import heapq
+import collections
+import itertools
 import xml.etree.ElementTree as ET
 from glob import glob
 
@@ -38,7 +40,7 @@ class Playlist(object):
 		'''
 		Initiates the playlist.
 
-		:param songs: List of available songs
+		:param songs: List or tuple of available songs
 		:param remember: How many songs shall (minimum) be remembered to allow going back
 		'''
 
@@ -47,7 +49,7 @@ class Playlist(object):
 		else:
 			self.remember = 0
 
-		self.songs = songs[:]
+		self.songs = tuple(songs)	# The songs are never changed, so a tuple is sufficient (and not copied again, if songs is already a tuple)
 		self.playlist = []
 		self.nowPlaying = -1
 
@@ -61,7 +63,7 @@ class Playlist(object):
 		if len(self.songs) == 1:
 			self.playlist.append(self.songs[0])
 		else:
-			newSonglist = self.songs[:]
+			newSonglist = list(self.songs)
 			random.shuffle(newSonglist)
 
 			if self.playlist:
@@ -122,7 +124,7 @@ class Playlist(object):
 
 		# If there is only one song in total
 		if len(self.songs) == 1:
-			return self.songs	# [the_only_song]
+			return self.songs	# (the_only_song, )
 
 		# If the first song did not yet start to play
 		if self.nowPlaying < 0:
@@ -144,9 +146,11 @@ class Theme(object):
 	Container for one theme including its songs and sounds.
 	'''
 
+	__slots__ = ('key', 'name', 'songs', 'sounds', 'occurences', 'colorText', 'colorBackground', 'colorEmph', 'colorFade')
+
 	def __init__(self, key, name, colorText, colorBackground, colorEmph, colorFade, songs = None, sounds = None, occurences = None):
 		'''
-		Initiates the theme.
+		Initiates the theme. The arguments are taken as they are, so they must already have the right types.
 
 		:param key: The keyboard key to activate the theme. Must be a one-letter string.
 		:param name: String with the name of the theme.
@@ -156,11 +160,11 @@ class Theme(object):
 		:param colorFade: The fading color for this theme
 		:param songs: A list with songs in the theme.
 		:param sounds: A list with sounds in the theme.
-		:param occurences: A list with occurences of the songs in the theme.
+		:param occurences: A list with cumulative occurences of the sounds in the theme.
 		'''
 
-		self.key = str(key)[0]
-		self.name = str(name)
+		self.key = key
+		self.name = name
 
 		if songs is None:
 			self.songs = []
@@ -186,14 +190,10 @@ class Theme(object):
 	def __str__(self):
 		''' :returns: A string representation of the theme with all songs and sounds. '''
 
-		ret = []
-		ret.append(''.join((self.key, ') ', self.name)))
-		ret.append('Songs:')
-		for s in self.songs:
-			ret.append('    ' + str(s))
+		ret = ['{}) {}'.format(self.key, self.name), 'Songs:']
+		ret.extend(['    {}'.format(s) for s in self.songs])
 		ret.append('Sounds:')
-		for s in self.sounds:
-			ret.append('    ' + str(s))
+		ret.extend(['    {}'.format(s) for s in self.sounds])
 
 		return '\n'.join(ret)
 
@@ -218,12 +218,33 @@ class Theme(object):
 		self.sounds.append(sound)
 
 
+	def addSongs(self, songs):
+		'''
+		Add several songs to the theme at once.
+
+		:param songs: List of the Song objects to add
+		'''
+
+		self.songs.extend(songs)
+
+
+	def addSounds(self, sounds):
+		'''
+		Add several sounds to the theme at once.
+
+		:param sounds: List of the Sound objects to add
+		'''
+
+		self.sounds.extend(sounds)
+
+
 	def addOccurences(self, occurences):
 		'''
-		Adds a list of occurences to the theme. The total number of occurences after the addition must be the same as the total number of songs in the theme. So add the songs first.
+		Adds a list of occurences to the theme. The total number of occurences after the addition must be the same as the total number of sounds in the theme. So add the sounds first.
+		The occurences are cumulative and only kept in the theme; the sounds keep their own, relative occurence.
 
-		:param occurences: List of occurences of the songs
-		:raises KeyError: When the total number of occurences does not fit the total number of songs in the theme
+		:param occurences: List (or any iterable) of cumulative occurences of the sounds
+		:raises KeyError: When the total number of occurences does not fit the total number of sounds in the theme
 		'''
 
 		self.occurences.extend(occurences)
@@ -231,9 +252,6 @@ class Theme(object):
 		if len(self.occurences) != len(self.sounds):
 			raise KeyError('The number of sounds is not equal to the number of occurences in {}!'.format(self.name))
 
-		for i in range(len(self.sounds)):
-			self.sounds[i].occurence = self.occurences[i]
-
 
 	# CLASS Theme END
 
@@ -243,9 +261,11 @@ class Sound(object):
 	Container for one sound.
 	'''
 
-	def __init__(self, filename, name, volume = 1, cooldown = 10, occurence = 0.01, loop = False):
+	__slots__ = ('filename', 'name', 'volume', 'cooldown', 'occurence', 'loop', 'obj', 'length')	# obj is the pygame Sound object and length its length in seconds. Both are attached when the sound is loaded
+
+	def __init__(self, filename, name, volume = 1.0, cooldown = 10.0, occurence = 0.01, loop = False):
 		'''
-		Initiates the sound.
+		Initiates the sound. The arguments are taken as they are, so they must already have the right types.
 
 		:param filename: String with the filename
 		:param name: String with the name
@@ -255,20 +275,21 @@ class Sound(object):
 		:param loop: Boolean whether the sound shall be played indefinitely or not. `occurence` is disregarded when loop is True.
 		'''
 
-		self.filename = str(filename)
-		self.name = str(name)
-		self.volume = float(volume)
-		self.cooldown = float(cooldown)
-		self.occurence = float(occurence)
-		self.loop = bool(loop)
-		if self.loop:
+		self.filename = filename
+		self.name = name
+		self.volume = volume
+		self.cooldown = cooldown
+		self.loop = loop
+		if loop:
 			self.occurence = 0.01
+		else:
+			self.occurence = occurence
 
 
 	def __str__(self):
 		''' :returns: A string representation of the sound with all attributes. '''
 
-		return ''.join((self.filename, ' (vol: ', str(self.volume), ', occ: ', '{:.4f}'.format(self.occurence), ', cd: ', str(self.cooldown), ', loop: ', str(self.loop), ')'))
+		return '{} (vol: {}, occ: {:.4f}, cd: {}, loop: {})'.format(self.filename, self.volume, self.occurence, self.cooldown, self.loop)
 
 
 	# CLASS Sound END
@@ -279,24 +300,26 @@ class Song(object):
 	Container for one song.
 	'''
 
-	def __init__(self, filename, name, volume = 1):
+	__slots__ = ('filename', 'name', 'volume')
+
+	def __init__(self, filename, name, volume = 1.0):
 		'''
-		Initiates the song.
+		Initiates the song. The arguments are taken as they are, so they must already have the right types.
 
 		:param filename: String with the filename
 		:param name: String with the name
 		:param volume: Float with the relative volume (already adjusted by the theme volume)
 		'''
 
-		self.filename = str(filename)
-		self.name = str(name)
-		self.volume = float(volume)
+		self.filename = filename
+		self.name = name
+		self.volume = volume
 
 
 	def __str__(self):
 		''' :returns: A string representation of the song with its volume. '''
 
-		return ''.join((self.filename, ' (vol: ', str(self.volume), ')'))
+		return '{} (vol: {})'.format(self.filename, self.volume)
 
 
 	# CLASS Song END
@@ -307,9 +330,11 @@ class GlobalEffect(object):
 	Container for one global effect.
 	'''
 
-	def __init__(self, filename, key, name, volume = 1, interrupting = True):
+	__slots__ = ('filename', 'key', 'name', 'volume', 'interrupting', 'obj')	# obj is the pygame Sound object that is attached when the sound is loaded
+
+	def __init__(self, filename, key, name, volume = 1.0, interrupting = True):
 		'''
-		Initiates the global effect.
+		Initiates the global effect. The arguments are taken as they are, so they must already have the right types.
 
 		:param filename: String with the filename
 		:param key: The keyboard key to activate the global effect. Must be a one-letter string.
@@ -318,21 +343,17 @@ class GlobalEffect(object):
 		:param interrupting: Boolean that indicates, whether the global effect should interrupt playing music and sounds, or not.
 		'''
 
-		self.filename = str(filename)
-		self.key = str(key)[0]
-		self.name = str(name)
-		self.volume = float(volume)
-		self.interrupting = bool(interrupting)
+		self.filename = filename
+		self.key = key
+		self.name = name
+		self.volume = volume
+		self.interrupting = interrupting
 
 
 	def __str__(self):
 		''' :returns: A string representation of the global effect with its attributes. '''
 
-		if self.interrupting:
-			s = ', interrupting'
-		else:
-			s = ''
-		return ''.join((self.key, ') ', self.name, ': ', self.filename, ' (vol: ', str(self.volume), s, ')'))
+		return '{}) {}: {} (vol: {}{})'.format(self.key, self.name, self.filename, self.volume, ', interrupting' if self.interrupting else '')
 
 
 	# CLASS GlobalEffect END
@@ -349,13 +370,14 @@ class RPGbox(object):
 	MIN_BASETIME = 1			# Minimum basetime is 1 second
 	MAX_BASETIME = 36000		# Maximum basetime is 36 000 seconds (10 hours)
 	DEFAULT_OCCURENCE = 0.01	# Default occurence is 0.01 (1% of basetime)
-	MIN_OCCURENCE = 0			# Minimum occurence is 0 (never)
-	MAX_OCCURENCE = 1			# Maximum occurence is 1 (always)
+	MIN_OCCURENCE = 0.0			# Minimum occurence is 0 (never)
+	MAX_OCCURENCE = 1.0			# Maximum occurence is 1 (always)
 	DEFAULT_VOLUME = 100		# Default volume is 100% (100)
-	MIN_VOLUME = 0				# Minimum volume is 0%
-	MAX_VOLUME = 1				# Maximum volume is 100% (1.0)
+	MIN_VOLUME = 0.0			# Minimum volume is 0%
+	MAX_VOLUME = 1.0			# Maximum volume is 100% (1.0)
 	DEFAULT_COOLDOWN = 10		# Default cooldown is 10 seconds
 	# MIN and MAX cooldown are not defined, as they are not needed
+	VALID_IDS = frozenset(range(48, 58)) | frozenset(range(97, 123))	# Allowed key IDs: 0-9 (48-57) and a-z (97-122)
 
 	# Default colors
 	COLOR_TEXT = '#000000'			# Text color: black
@@ -375,6 +397,10 @@ class RPGbox(object):
 		# Initiate class variables
 		self.themes = {}		# Saves theme keys and connects them to theme object {themeID: Theme(), ...}
 		self.globalEffects = {}	# Saves theme keys and connects them to global effect object {globalEffectID: GlobalEffect(), ...}
+		self.songCache = {}		# Saves each distinct song only once {(filename, name, volume): Song(), ...}
+		self.colorCache = {}	# Parses each distinct color string only once {colorString: Color(), ...}
+		self.nameCache = {}		# Prettifies each distinct path only once {path: name, ...}
+		self.globCache = {}		# Searches each distinct file pattern only once {pattern: [filename, ...], ...}
 
 		# Read in the file, parse it and point to root
 		root = ET.parse(filename).getroot()
@@ -384,17 +410,8 @@ class RPGbox(object):
 			raise NoValidRPGboxError('No valid RPGbox file!')
 
 		# If a config is given, read it. If not, use default values.
-		try:
-			config = next(root.iter('config'))
-			self.colorText = pygame.Color(config.get('textcolor', default = self.COLOR_TEXT))
-			self.colorBackground = pygame.Color(config.get('bgcolor', default = self.COLOR_BG))
-			self.colorEmph = pygame.Color(config.get('emphcolor', default = self.COLOR_EMPH))
-			self.colorFade = pygame.Color(config.get('fadecolor', default = self.COLOR_FADE))
-		except StopIteration:
-			self.colorText = pygame.Color(self.COLOR_TEXT)
-			self.colorBackground = pygame.Color(self.COLOR_BG)
-			self.colorEmph = pygame.Color(self.COLOR_EMPH)
-			self.colorFade = pygame.Color(self.COLOR_FADE)
+		defaultColors = (self._getColor(self.COLOR_TEXT), self._getColor(self.COLOR_BG), self._getColor(self.COLOR_EMPH), self._getColor(self.COLOR_FADE))
+		self.colorText, self.colorBackground, self.colorEmph, self.colorFade = self._readColors(next(root.iter('config'), None), defaultColors)
 
 		# Scan through globals
 		for globalTag in root.iter('globals'):
@@ -404,31 +421,27 @@ class RPGbox(object):
 
 			for effect in globalTag.iter('effect'):
 				# Get name of the global effect (each global effect must have a name!)
-				try:
-					effectName = effect.attrib['name']
-				except KeyError:
+				effectName = effect.get('name')
+				if effectName is None:
 					raise NoValidRPGboxError('A global effect without name was found. Each global effect must have a name!')
 
 				# Get the keyboard key of the effect (each global effect must have a unique key!)
-				try:
-					effectKey = effect.attrib['key'][0].lower() # get only first char and make it lowercase.
-					effectID = ord(effectKey)
-				except KeyError:
+				effectKey = effect.get('key')
+				if effectKey is None:
 					raise NoValidRPGboxError('A global effect without key was found. Each global effect must have a unique keyboard key!')
+				effectKey = effectKey[0].lower() # get only first char and make it lowercase.
+				effectID = ord(effectKey)
 
 				if effectID in self.globalEffects:
 					raise NoValidRPGboxError('The key {} is already in use.'.format(effectKey))
 				self._ensureValidID(effectID)	# Ensure that the id is valid
 
 				# Get the effect file from the tag attribute
-				try:
-					effectFile = effect.attrib['file']
-					if not os.path.isfile(effectFile):
-						effectFile = None
-				except KeyError:
-					raise NoValidRPGboxError('No file given in global effect.')
+				effectFile = effect.get('file')
 				if effectFile is None:
-					raise NoValidRPGboxError('File {} not found in global.'.format(effect.attrib['file']))
+					raise NoValidRPGboxError('No file given in global effect.')
+				if not os.path.isfile(effectFile):
+					raise NoValidRPGboxError('File {} not found in global.'.format(effectFile))
 
 				# Get potential volume of the effect. Alter it by the globals volume
 				effectVolume = int(effect.get('volume', default = self.DEFAULT_VOLUME)) / 100.0
@@ -444,20 +457,19 @@ class RPGbox(object):
 		for theme in root.iter('theme'):
 
 			# Get the keyboard key of the theme (each theme must have a unique key!)
-			try:
-				themeKey = theme.attrib['key'][0].lower() # get only first char and make it lowercase.
-				themeID = ord(themeKey)
-			except KeyError:
+			themeKey = theme.get('key')
+			if themeKey is None:
 				raise NoValidRPGboxError('A theme without key was found. Each theme must have a unique keyboard key!')
+			themeKey = themeKey[0].lower() # get only first char and make it lowercase.
+			themeID = ord(themeKey)
 
 			if themeID in self.themes or themeID in self.globalEffects:
 				raise NoValidRPGboxError('The key {} is already in use. Found in {}'.format(themeKey, themeID))
 			self._ensureValidID(themeID)	# Ensure that the id is valid
 
 			# Get the theme name. Each theme must have a name!
-			try:
-				themeName = theme.attrib['name']
-			except KeyError:
+			themeName = theme.get('name')
+			if themeName is None:
 				raise NoValidRPGboxError('A theme without name was found. Each theme must have a name!')
 
 			# Get the theme volume. If not available, use default volume.
@@ -469,70 +481,44 @@ class RPGbox(object):
 			basetime = int(theme.get('basetime', default = self.DEFAULT_BASETIME))
 			basetime = self._ensureBasetime(basetime)
 
-			# If a config is given, read it. If not, use default values.
-			try:
-				config = next(theme.iter('config'))
-				try:
-					colorText = pygame.Color(config.attrib['textcolor'])
-				except KeyError:
-					colorText = self.colorText
-
-				try:
-					colorBackground = pygame.Color(config.attrib['bgcolor'])
-				except KeyError:
-					colorBackground = self.colorBackground
-
-				try:
-					colorEmph = pygame.Color(config.attrib['emphcolor'])
-				except KeyError:
-					colorEmph = self.colorEmph
-
-				try:
-					colorFade = pygame.Color(config.attrib['fadecolor'])
-				except KeyError:
-					colorFade = self.colorFade
-			except StopIteration:
-				colorText = self.colorText
-				colorBackground = self.colorBackground
-				colorEmph = self.colorEmph
-				colorFade = self.colorFade
-
-			# Create the theme and add it to the themes dict
-			self.themes[themeID] = Theme(key = themeKey, name = themeName, colorText = colorText, colorBackground = colorBackground, colorEmph = colorEmph, colorFade = colorFade)
-
-			# Initiate the occurences list. First element must be 0
-			occurences = [0]
+			# If a config is given, read it. If not, use the colors of the box.
+			colorText, colorBackground, colorEmph, colorFade = self._readColors(next(theme.iter('config'), None), (self.colorText, self.colorBackground, self.colorEmph, self.colorFade))
+
+			# Create the theme and add it to the themes dict. The theme object is kept at hand, as all songs and sounds below are added to it
+			themeObj = Theme(key = themeKey, name = themeName, colorText = colorText, colorBackground = colorBackground, colorEmph = colorEmph, colorFade = colorFade)
+			self.themes[themeID] = themeObj
+
+			# Collect the relative occurence of each sound in the order the sounds are added
+			soundOccurences = []
 
 			# Scan through all subtags and get data like background songs and sound effects
 			for subtag in theme:
 				# <background> tag found
 				if subtag.tag == 'background':
 					# Get the song file(s) from the attribute of the tag (can be a glob)
-					try:
-						songFiles = glob(subtag.attrib['file'])
-					except KeyError:
+					songPattern = subtag.get('file')
+					if songPattern is None:
 						raise NoValidRPGboxError('No file given in background of {}'.format(themeName))
+					songFiles = self._glob(songPattern)
 					if not songFiles:
-						raise NoValidRPGboxError('File {} not found in {}'.format(subtag.attrib['file'], themeName))
+						raise NoValidRPGboxError('File {} not found in {}'.format(songPattern, themeName))
 
 					# Get potential volume of song. Alter it by the theme volume
 					volume = int(subtag.get('volume', default = self.DEFAULT_VOLUME)) / 100.0
 					volume = self._ensureVolume(volume * themeVolume)
 
 					# Save each song with its volume. If a filename occurs more than once, basically, the volume is updated
-					for songFile in songFiles:
-						name = self.prettifyPath(songFile)
-						self.themes[themeID].addSong(Song(songFile, name, volume))
+					themeObj.addSongs([self._getSong(songFile, self.prettifyPath(songFile), volume) for songFile in songFiles])
 
 				# <effect> tag found
 				elif subtag.tag == 'effect':
 					# Get the sound file(s) from the attribute of the tag (can be a glob)
-					try:
-						soundFiles = glob(subtag.attrib['file'])
-					except KeyError:
+					soundPattern = subtag.get('file')
+					if soundPattern is None:
 						raise NoValidRPGboxError('No file given in effect of {}'.format(themeName))
+					soundFiles = self._glob(soundPattern)
 					if not soundFiles:
-						raise NoValidRPGboxError('File {} not found in {}'.format(subtag.attrib['file'], themeName))
+						raise NoValidRPGboxError('File {} not found in {}'.format(soundPattern, themeName))
 
 					# Get relative volume of the sound. Alter it by the theme volume
 					volume = int(subtag.get('volume', default = self.DEFAULT_VOLUME)) / 100.0
@@ -549,10 +535,8 @@ class RPGbox(object):
 					loop = ('loop' in subtag.attrib and self._interpretBool(subtag.attrib['loop']))
 
 					# Save each sound with its volume. If a filename occurs more than once, basically, the volume and occurence are updated
-					for soundFile in soundFiles:
-						name = self.prettifyPath(soundFile)
-						self.themes[themeID].addSound(Sound(soundFile, name=name, volume=volume, cooldown=cooldown, loop=loop))
-						occurences.append(occurences[-1] + occurence)
+					themeObj.addSounds([Sound(soundFile, name=self.prettifyPath(soundFile), volume=volume, cooldown=cooldown, occurence=occurence, loop=loop) for soundFile in soundFiles])
+					soundOccurences.extend([occurence] * len(soundFiles))
 
 				# config tag found. That was already analysed, so we just ignore it silently
 				elif subtag.tag == 'config':
@@ -563,13 +547,12 @@ class RPGbox(object):
 					print('Unknown Tag {}. Ignoring it.'.format(attr.tag), file=sys.stderr)
 
 			# Ensure, that all sounds CAN be played. If the sum of occurences is higher than one, normalize to one
-			if occurences[-1] > self.MAX_OCCURENCE:
-				divisor = occurences[-1]
-				for i in range(len(occurences)):
-					occurences[i] /= divisor
+			total = sum(soundOccurences)
+			if total > self.MAX_OCCURENCE:
+				soundOccurences = [o / total for o in soundOccurences]
 
-			# Add occurences to the theme
-			self.themes[themeID].addOccurences(occurences[1:])
+			# Add the cumulative occurences to the theme
+			themeObj.addOccurences(itertools.accumulate(soundOccurences))
 
 		# Test, whether there is at least one theme in the whole box
 		if not self.themes:
@@ -580,12 +563,12 @@ class RPGbox(object):
 		''' :returns: All themes and global effects in the box. '''
 
 		ret = ['RPGmusicbox', 'Themes']
-		for t in sorted(self.themes.keys()):
+		for t in sorted(self.themes):
 			ret.append(str(self.themes[t]))
 
 		ret.append('Global effects')
 
-		for e in sorted(self.globalEffects.keys()):
+		for e in sorted(self.globalEffects):
 			ret.append(str(self.globalEffects[e]))
 
 		return '\n'.join(ret)
@@ -599,11 +582,90 @@ class RPGbox(object):
 		:returns: The prettified filename
 		'''
 
-		path = os.path.basename(path)
-		path = os.path.splitext(path)[0]
-		path = path.replace('_', ' ')
+		name = self.nameCache.get(path)
+		if name is None:
+			name = os.path.basename(path)
+			dot = name.rfind('.')
+			if dot > 0:		# A leading dot (hidden file) does not start an extension
+				name = name[:dot]
+			name = name.replace('_', ' ')
+			self.nameCache[path] = name
+
+		return name
+
+
+	def _readColors(self, config, defaults):
+		'''
+		Reads the colors from a <config> tag. Colors that are not given in the tag are taken from the defaults, such that the default Color objects are reused and not parsed again.
+
+		:param config: The <config> tag or None, if there is no <config> tag
+		:param defaults: Tuple with the default colors (text, background, emphasizing, fading)
+		:returns: Tuple with the colors (text, background, emphasizing, fading)
+		'''
+
+		if config is None:
+			return defaults
+
+		colors = []
+		for attribute, default in zip(('textcolor', 'bgcolor', 'emphcolor', 'fadecolor'), defaults):
+			value = config.get(attribute)
+			if not value:
+				colors.append(default)
+			else:
+				colors.append(self._getColor(value))
+
+		return tuple(colors)
+
+
+	def _getSong(self, filename, name, volume):
+		'''
+		Returns a Song object for the given attributes. Songs with the same attributes (e.g. the same file in several themes) share one Song object.
+
+		:param filename: String with the filename
+		:param name: String with the name
+		:param volume: Float with the relative volume (already adjusted by the theme volume)
+		:returns: The Song object
+		'''
+
+		key = (filename, name, volume)
+		song = self.songCache.get(key)
+		if song is None:
+			song = Song(filename, name, volume)
+			self.songCache[key] = song
+
+		return song
+
+
+	def _glob(self, pattern):
+		'''
+		Returns the files that match the given pattern. Themes often share the same patterns, so the file system is only searched once for each distinct pattern.
+
+		:param pattern: String with the file pattern (can be a glob)
+		:returns: List with the matching filenames
+		'''
+
+		files = self.globCache.get(pattern)
+		if files is None:
+			files = glob(pattern)
+			self.globCache[pattern] = files
+
+		return files
+
+
+	def _getColor(self, value):
+		'''
+		Returns a Color object for the given color string. Themes often use the same colors, so each distinct string is only parsed once.
+
+		:param value: String with the color (e.g. '#c80000' or 'red')
+		:returns: The Color object
+		'''
+
+		color = self.colorCache.get(value)
+		if color is None:
+			color = pygame.Color(value)
+			self.colorCache[value] = color
 
-		return path
+		return color
 
 
 	def _ensureValidID(self, kid):
@@ -614,8 +676,7 @@ class RPGbox(object):
 		:raises: NoValidRPGboxError
 		'''
 
-		# Allowed: 0-9, a-z
-		if not (48 <= kid <= 57 or 97 <= kid <= 122):
+		if kid not in self.VALID_IDS:
 			raise NoValidRPGboxError('The key {} is not in the allowed range (a-z and 0-9; lowercase only!)'.format(chr(kid)))
 
 
@@ -627,12 +688,7 @@ class RPGbox(object):
 		:returns: The volume, that is guaranteed to be within the allowed range
 		'''
 
-		if v < self.MIN_VOLUME:
-			return self.MIN_VOLUME
-		elif v > self.MAX_VOLUME:
-			return self.MAX_VOLUME
-
-		return v
+		return min(max(v, self.MIN_VOLUME), self.MAX_VOLUME)
 
 
 	def _interpretBool(self, s):
@@ -654,12 +710,7 @@ class RPGbox(object):
 		:returns: The basetime, that is guaranteed to be within the allowed range
 		'''
 
-		if b < self.MIN_BASETIME:
-			return self.MIN_BASETIME
-		elif b > self.MAX_BASETIME:
-			return self.MAX_BASETIME
-
-		return b
+		return min(max(b, self.MIN_BASETIME), self.MAX_BASETIME)
 
 
 	def _ensureOccurence(self, o):
@@ -670,12 +721,7 @@ class RPGbox(object):
 		:returns: The occurence, that is guaranteed to be within the allowed range
 		'''
 
-		if o < self.MIN_OCCURENCE:
-			return self.MIN_OCCURENCE
-		elif o > self.MAX_OCCURENCE:
-			return self.MAX_OCCURENCE
-
-		return o
+		return min(max(o, self.MIN_OCCURENCE), self.MAX_OCCURENCE)
 
 
 	def getIDs(self):
@@ -717,6 +763,8 @@ class Player(object):
 	COLOR_EMPH = (200, 0, 0)		# Emphasizing color: red
 	COLOR_FADE = (127, 127, 127)	# Fading color: grey
 
+	TEXT_CACHE_SIZE = 512	# Maximum number of rendered texts that are kept for reuse
+
 	def __init__(self, box, debug = False):
 		'''
 		Initiates all necessary stuff for playing an RPGbox.
@@ -729,9 +777,8 @@ class Player(object):
 
 		self.box = box
 
-		# Initialize pygame, screen and clock
+		# Initialize pygame and screen
 		pygame.init()
-		self.clock = pygame.time.Clock()
 		self.screen = pygame.display.set_mode((800, 600))	# Screen is 800*600 px large
 		pygame.display.set_caption('RPGbox player')		# Set window title
 
@@ -741,10 +788,8 @@ class Player(object):
 		self.colorEmph = self.box.colorEmph
 		self.colorFade = self.box.colorFade
 
-		# Fill background
-		self.background = pygame.Surface(self.screen.get_size()).convert()
-		self.background.fill(self.colorBackground)
-		self.screen.blit(self.background, (0, 0))
+		# Fill the screen. The panels are later drawn directly onto it
+		self.screen.fill(self.colorBackground)
 		pygame.display.flip()
 
 		# Create my own event to indicate that a song stopped playing to trigger a new song
@@ -757,11 +802,23 @@ class Player(object):
 		self.globalChannel = pygame.mixer.Channel(0)
 		self.globalChannel.set_endevent(self.GLOBAL_END)
 
+		# Create my own event that triggers random sound effects about every second (the timer is started in start())
+		self.SOUND_TICK = pygame.USEREVENT + 3
+
+		# Remove clutter from the event queue. All events are blocked except for the ones used in start()
+		self.allowedEvents = [pygame.QUIT, pygame.KEYDOWN, self.SONG_END, self.GLOBAL_END, self.SOUND_TICK]
+		pygame.event.set_blocked(None)
+		pygame.event.set_allowed(self.allowedEvents)
+		pygame.event.clear()	# Drop the events that were queued before blocking (e.g. from pygame.init())
+
 		# Initiate text stuff
 		self.standardFont = pygame.font.Font(None, 24)
 		self.headerFont = pygame.font.Font(None, 32)
+		self.textCache = collections.OrderedDict()	# Rendered texts in least recently used order {(text, color, fontID): Surface(), ...}
+		self.panelStates = {}	# The state each panel was drawn with the last time {panelName: stateTuple, ...}
+		self.dirtyRects = {}	# Areas of the screen that changed and must be updated on the display. Each panel is only listed once per cycle {panelName: Rect(), ...}
 
-		w, h = self.background.get_size()
+		w, h = self.screen.get_size()
 		self.displayWidth = w
 		self.displayPanelWidth = w // 3
 		self.displayFooterWidth = w // 6
@@ -770,31 +827,59 @@ class Player(object):
 		self.displayFooterHeight = h - self.displayPanelHeight
 		self.displayBorder = 5
 
-		self.textGlobalKeys = pygame.Surface((self.displayPanelWidth, self.displayPanelHeight))
-		self.textThemeKeys = pygame.Surface((self.displayPanelWidth, self.displayPanelHeight))
-		self.textNowPlaying = pygame.Surface((self.displayWidth - 2*self.displayPanelWidth, self.displayPanelHeight))	# The displayWidth - 2*panelWidth fills the rounding error pixels on the right side
-		self.textFooter = pygame.Surface((self.displayWidth, self.displayFooterHeight)) # The footer stretches horizontally to 100%. The displayFooterWidth is for the single elements in the footer.
+		# All surfaces are created once and converted to the display format, such that blitting them is fast
+		self.textGlobalKeys = pygame.Surface((self.displayPanelWidth, self.displayPanelHeight)).convert()
+		self.textThemeKeys = pygame.Surface((self.displayPanelWidth, self.displayPanelHeight)).convert()
+		self.textNowPlaying = pygame.Surface((self.displayWidth - 2*self.displayPanelWidth, self.displayPanelHeight)).convert()	# The displayWidth - 2*panelWidth fills the rounding error pixels on the right side
+		self.textFooter = pygame.Surface((self.displayWidth, self.displayFooterHeight)).convert() # The footer stretches horizontally to 100%. The displayFooterWidth is for the single elements in the footer.
+		self.footerElements = [pygame.Surface((self.displayFooterWidth, self.displayFooterHeight)).convert() for i in range(6)]	# One surface for each of the six elements in the footer
 
 		# Initialize variables
-		self.globalIDs, self.themeIDs = self.box.getIDs()
+		# The IDs are only used for membership tests, so they are saved as sets
+		globalIDs, themeIDs = self.box.getIDs()
+		self.globalIDs = frozenset(globalIDs)
+		self.themeIDs = frozenset(themeIDs)
+		# The themes never change, so their labels are only created once (sorted by key) [(themeID, label), ...]
+		self.themeLabels = [(k, ''.join((chr(k), ' - ', self.box.themes[k].name))) for k in sorted(self.themeIDs)]
 		self.globalEffects = None
+		self.loadedSounds = {}	# Each sound file is only loaded once per volume {(filename, volume): pygame.mixer.Sound(), ...}
 		self.initializeGlobalEffects()
+		self.initializeThemeSounds()
 		self.activeSounds = []
 		self.activeGlobalEffect = None
 		self.occurences = []
+		self.maxOccurence = 0	# The last (i.e. highest) value of self.occurences
 		self.playlist = Playlist([])
 		self.activeTheme = None
 		self.activeThemeID = None
 
-		self.cycle = 0
 		self.allowMusic = True
 		self.allowSounds = True
 		self.allowCustomColors = True
 		self.paused = False
 		self.newSongWhilePause = False
 		self.interruptingGlobalEffect = False
-		self.activeChannels = []
-		self.blockedSounds = {}	# {filename: timeToStartAgain, ...}
+		self.activeChannels = []		# The channels of all sounds that are (potentially) still playing
+		self.activeChannelNames = []	# The names of the sounds in self.activeChannels (same order)
+		self.blockedSounds = {}	# Sounds that may not be played before the given time (in ms, see pygame.time.get_ticks()) {filename: timeToStartAgain, ...}
+		self.blockedQueue = []	# Heap with the same times as blockedSounds, such that the earliest time is always first [(timeToStartAgain, filename), ...]
+
+		# The numpad keys and the number keys they stand for {numpadKey: numberKey, ...}
+		self.numpadKeys = {
+			pygame.K_KP0: pygame.K_0, pygame.K_KP1: pygame.K_1, pygame.K_KP2: pygame.K_2, pygame.K_KP3: pygame.K_3, pygame.K_KP4: pygame.K_4,
+			pygame.K_KP5: pygame.K_5, pygame.K_KP6: pygame.K_6, pygame.K_KP7: pygame.K_7, pygame.K_KP8: pygame.K_8, pygame.K_KP9: pygame.K_9,
+		}
+
+		# The actions of the keys that do always the same thing {key: function, ...}
+		self.keyActions = {
+			pygame.K_SPACE: self.togglePause,							# (un)pause everything
+			pygame.K_RIGHT: self.playMusic,								# next song
+			pygame.K_LEFT: lambda: self.playMusic(previous = True),		# previous song
+			pygame.K_F1: self.toggleAllowMusic,							# (dis)allow Music
+			pygame.K_F2: self.toggleAllowSounds,						# (dis)allow Sounds
+			pygame.K_F5: self.toggleAllowCustomColors,					# (dis)allow custom colors
+			pygame.K_F10: self.toggleDebugOutput,						# do (not) print debug info to stdout
+		}
 
 		# Start visualisation
 		self.updateTextAll()
@@ -811,6 +896,23 @@ class Player(object):
 			print(t)
 
 
+	def _loadSound(self, filename, volume):
+		'''
+		Loads a sound file to RAM and adjusts its volume. Each file is only loaded once per volume.
+
+		:param filename: String with the filename
+		:param volume: Float with the volume
+		:returns: The pygame Sound object
+		'''
+
+		key = (filename, volume)
+		if key not in self.loadedSounds:
+			self.loadedSounds[key] = pygame.mixer.Sound(filename)
+			self.loadedSounds[key].set_volume(volume)
+
+		return self.loadedSounds[key]
+
+
 	def initializeGlobalEffects(self):
 		'''
 		Loads the file for each global effect to RAM and adjust its volume to have it ready.
@@ -819,8 +921,21 @@ class Player(object):
 		self.globalEffects = self.box.getGlobalEffects()
 
 		for e in self.globalEffects:
-			self.globalEffects[e].obj = pygame.mixer.Sound(self.globalEffects[e].filename)
-			self.globalEffects[e].obj.set_volume(self.globalEffects[e].volume)
+			self.globalEffects[e].obj = self._loadSound(self.globalEffects[e].filename, self.globalEffects[e].volume)
+
+		# The global effects never change, so their labels are only created once (sorted by key) [(globalEffectID, label), ...]
+		self.globalEffectLabels = [(k, ''.join((chr(k), ' - ', self.globalEffects[k].name))) for k in sorted(self.globalEffects.keys())]
+
+
+	def initializeThemeSounds(self):
+		'''
+		Loads the file for each sound of each theme to RAM and adjust its volume, such that switching themes does not need to read any files. The length of each sound is saved as well.
+		'''
+
+		for themeID in self.themeIDs:
+			for sound in self.box.getTheme(themeID).sounds:
+				sound.obj = self._loadSound(sound.filename, sound.volume)
+				sound.length = sound.obj.get_length()
 
 
 	def toggleDebugOutput(self):
@@ -868,8 +983,8 @@ class Player(object):
 			self.debugPrint('Music switched off')
 		else:
 			self.allowMusic = True
-			pygame.event.post(pygame.event.Event(self.SONG_END))
 			self.debugPrint('Music switched on')
+			self.playMusic()
 		self.updateTextFooter()
 
 
@@ -880,7 +995,7 @@ class Player(object):
 			self.allowSounds = False
 			if self.activeChannels:
 				for c in self.activeChannels:
-					c[1].stop()
+					c.stop()
 			self.updateTextNowPlaying()
 			self.debugPrint('Sound switched off')
 		else:
@@ -915,155 +1030,197 @@ class Player(object):
 
 
 	def updateTextAll(self):
-		''' Update the whole screen. '''
-		self.background.fill(self.colorBackground)
-		self.updateTextGlobalEffects(update = False)
-		self.updateTextThemes(update = False)
-		self.updateTextNowPlaying(update = False)
-		self.updateTextFooter(update = False)
+		''' Update the whole screen. The four panels cover the whole screen, so it does not need to be filled first. '''
+		self.updateTextGlobalEffects()
+		self.updateTextThemes()
+		self.updateTextNowPlaying()
+		self.updateTextFooter()
 
-		pygame.display.flip()
 
+	def updateDisplay(self):
+		'''
+		Updates all areas of the display that were changed since the last call in one go.
+		'''
+
+		if not self.dirtyRects:
+			return
+
+		pygame.display.update(list(self.dirtyRects.values()))
+		self.dirtyRects = {}
+
+
+	def renderText(self, t, color, font):
+		'''
+		Renders a text or takes it from the cache, if the same text was rendered before with the same color and font.
+
+		:param t: The text to be rendered
+		:param color: The color of the text
+		:param font: The font object that shall be rendered
+		:returns: A surface with the rendered text
+		'''
+
+		key = (t, tuple(color), id(font))
+
+		if key in self.textCache:
+			self.textCache.move_to_end(key)
+			return self.textCache[key]
 
-	def showLine(self, area, t, color, font):
+		textSurface = font.render(t, True, color)
+		self.textCache[key] = textSurface
+
+		if len(self.textCache) > self.TEXT_CACHE_SIZE:
+			self.textCache.popitem(last = False)
+
+		return textSurface
+
+
+	def showLine(self, surface, area, t, color, font):
 		'''
 		Prints one line of text to a panel.
 
-		:param area: A rect with information, where the text shall be blitted on the background
+		:param surface: The panel surface on which the text shall be blitted
+		:param area: A rect with information, where the text shall be blitted on the panel surface
 		:param t: The text to be rendered
 		:param color: The color of the text
 		:param font: The font object that shall be rendered
 		'''
 
-		textRect = font.render(t, True, color)
-		self.background.blit(textRect, area)
+		textRect = self.renderText(t, color, font)
+		surface.blit(textRect, area)
 		area.top += font.get_linesize()
 
 
-	def updateTextGlobalEffects(self, update = True):
+	def _panelChanged(self, panel, state):
 		'''
-		Update the global effects panel
+		Checks, whether the state a panel depends on has changed since the panel was drawn the last time, and remembers the new state.
 
-		:param update: Boolean to state, whether the display should be updated
+		:param panel: String with the name of the panel
+		:param state: A tuple with everything that determines the content of the panel
+		:returns: True, if the panel must be drawn again, False otherwise
 		'''
 
-		self.textGlobalKeys.fill(self.colorBackground)
-		r = self.background.blit(self.textGlobalKeys, (0, 0))
+		if self.panelStates.get(panel) == state:
+			return False
 
-		area = self.textGlobalKeys.get_rect()
-		area.left = self.displayBorder
-		area.top = self.displayBorder
+		self.panelStates[panel] = state
+		return True
 
-		self.showLine(area, 'Global Keys', self.colorText, self.headerFont)
-		self.showLine(area, '', self.colorText, self.standardFont)
 
-		for k in sorted(self.globalEffects.keys()):
-			t = ''.join((chr(k), ' - ', self.globalEffects[k].name))
-			if k == self.activeGlobalEffect:
-				self.showLine(area, t, self.colorEmph, self.standardFont)
-			else:
-				self.showLine(area, t, self.colorText, self.standardFont)
+	def updateTextGlobalEffects(self):
+		'''
+		Update the global effects panel. The panel is only drawn again and marked as dirty, if its content has changed.
+		'''
+
+		self._updateKeyPanel('globals', self.textGlobalKeys, 0, 'Global Keys', self.globalEffectLabels, self.activeGlobalEffect)
 
-		self.screen.blit(self.background, (0, 0))
 
-		if update:
-			pygame.display.update(r)
+	def updateTextThemes(self):
+		'''
+		Update the themes panel. The panel is only drawn again and marked as dirty, if its content has changed.
+		'''
+
+		self._updateKeyPanel('themes', self.textThemeKeys, self.displayPanelWidth, 'Themes', self.themeLabels, self.activeThemeID)
 
 
-	def updateTextThemes(self, update = True):
+	def _updateKeyPanel(self, panel, surface, left, header, labels, activeID):
 		'''
-		Update the themes panel
+		Draws a panel that lists keys with their labels and emphasizes the active one. The global effects and the themes panel only differ in these parameters.
 
-		:param update: Boolean to state, whether the display should be updated
+		:param panel: The name of the panel (for the panel states and dirty rects)
+		:param surface: The surface of the panel
+		:param left: The left position of the panel on the screen
+		:param header: String with the header of the panel
+		:param labels: List with the keys and their labels [(ID, label), ...]
+		:param activeID: The ID of the active key (or None)
 		'''
 
-		self.textThemeKeys.fill(self.colorBackground)
-		r = self.background.blit(self.textThemeKeys, (self.displayPanelWidth, 0))
+		state = (activeID, tuple(self.colorText), tuple(self.colorBackground), tuple(self.colorEmph))
+
+		# Nothing to do, if the panel still shows the current state
+		if not self._panelChanged(panel, state):
+			return
+
+		surface.fill(self.colorBackground)
 
-		area = self.textThemeKeys.get_rect()
-		area.left = self.displayPanelWidth + self.displayBorder
+		area = surface.get_rect()
+		area.left = self.displayBorder
 		area.top = self.displayBorder
 
-		self.showLine(area, 'Themes', self.colorText, self.headerFont)
-		self.showLine(area, '', self.colorText, self.standardFont)
+		self.showLine(surface, area, header, self.colorText, self.headerFont)
+		self.showLine(surface, area, '', self.colorText, self.standardFont)
 
-		for k in sorted(self.box.themes.keys()):
-			t = ''.join((chr(k), ' - ', self.box.themes[k].name))
-			if k == self.activeThemeID:
-				self.showLine(area, t, self.colorEmph, self.standardFont)
+		for k, t in labels:
+			if k == activeID:
+				self.showLine(surface, area, t, self.colorEmph, self.standardFont)
 			else:
-				self.showLine(area, t, self.colorText, self.standardFont)
-
-		self.screen.blit(self.background, (0, 0))
+				self.showLine(surface, area, t, self.colorText, self.standardFont)
 
-		if update:
-			pygame.display.update(r)
+		r = self.screen.blit(surface, (left, 0))
+		self.dirtyRects[panel] = r
 
 
-	def updateTextNowPlaying(self, update = True):
+	def updateTextNowPlaying(self):
 		'''
-		Update the now playing panel
-
-		:param update: Boolean to state, whether the display should be updated
+		Update the now playing panel. The panel is only drawn again and marked as dirty, if its content has changed.
 		'''
 
+		# Forget all channels that stopped playing, keeping both lists in the same order, in one pass
+		channels = []
+		names = []
+		for c, name in zip(self.activeChannels, self.activeChannelNames):
+			if c is not None and c.get_busy():
+				channels.append(c)
+				names.append(name)
+		self.activeChannels = channels
+		self.activeChannelNames = names
+
+		songs = self.playlist.getSongsForViewing()
+		if songs is not None:
+			songs = tuple(songs)
+		channelNames = tuple(sorted(self.activeChannelNames))
+
+		state = (songs, channelNames, tuple(self.colorText), tuple(self.colorBackground), tuple(self.colorEmph), tuple(self.colorFade))
+
+		# Nothing to do, if the panel still shows the current state
+		if not self._panelChanged('nowPlaying', state):
+			return
+
 		self.textNowPlaying.fill(self.colorBackground)
-		r = self.background.blit(self.textNowPlaying, (2 * self.displayPanelWidth, 0))
 
 		area = self.textNowPlaying.get_rect()
-		area.left = 2 * self.displayPanelWidth + self.displayBorder
+		area.left = self.displayBorder
 		area.top = self.displayBorder
 
-		self.showLine(area, 'Now Playing', self.colorText, self.headerFont)
-
-		songs = self.playlist.getSongsForViewing()
+		self.showLine(self.textNowPlaying, area, 'Now Playing', self.colorText, self.headerFont)
 
 		if songs is not None:
-			self.showLine(area, '', self.colorText, self.standardFont)
+			self.showLine(self.textNowPlaying, area, '', self.colorText, self.standardFont)
 
 			if len(songs) == 1:
-				self.showLine(area, '>> ' + songs[0].name, self.colorEmph, self.standardFont)
+				self.showLine(self.textNowPlaying, area, '>> ' + songs[0].name, self.colorEmph, self.standardFont)
 			elif len(songs) == 2:
 				if songs[0]:
-					self.showLine(area, songs[0].name, self.colorEmph, self.standardFont)
+					self.showLine(self.textNowPlaying, area, songs[0].name, self.colorEmph, self.standardFont)
 				else:
-					self.showLine(area, '', self.colorText, self.standardFont)
-				self.showLine(area, songs[1].name, self.colorText, self.standardFont)
+					self.showLine(self.textNowPlaying, area, '', self.colorText, self.standardFont)
+				self.showLine(self.textNowPlaying, area, songs[1].name, self.colorText, self.standardFont)
 			else:
-				self.showLine(area, songs[0].name, self.colorFade, self.standardFont)
-				self.showLine(area, songs[1].name, self.colorEmph, self.standardFont)
-				self.showLine(area, songs[2].name, self.colorText, self.standardFont)
-
-		if self.activeChannels:
-			toDelete = []
-			for i in range(len(self.activeChannels)):
-				if self.activeChannels[i][1] is None or not self.activeChannels[i][1].get_busy():
-					toDelete.append(i)
+				self.showLine(self.textNowPlaying, area, songs[0].name, self.colorFade, self.standardFont)
+				self.showLine(self.textNowPlaying, area, songs[1].name, self.colorEmph, self.standardFont)
+				self.showLine(self.textNowPlaying, area, songs[2].name, self.colorText, self.standardFont)
 
-			for i in toDelete[::-1]:
-				del(self.activeChannels[i])
+		if channelNames:
+			self.showLine(self.textNowPlaying, area, '', self.colorText, self.standardFont)
+			for name in channelNames:
+				self.showLine(self.textNowPlaying, area, name, self.colorEmph, self.standardFont)
 
-			# all members may have been deleted, that's why here is a new `if`
-			if self.activeChannels:
-				self.showLine(area, '', self.colorText, self.standardFont)
-				for name, c in sorted(self.activeChannels):
-					self.showLine(area, name, self.colorEmph, self.standardFont)
-
-		if self.blockedSounds:
-			to_delete = []
-			for k in list(self.blockedSounds.keys()):
-				if self.blockedSounds[k] < 0:
-					del self.blockedSounds[k]
-
-		self.screen.blit(self.background, (0, 0))
-
-		if update:
-			pygame.display.update(r)
+		r = self.screen.blit(self.textNowPlaying, (2 * self.displayPanelWidth, 0))
+		self.dirtyRects['nowPlaying'] = r
 
 
 	def showFooterElement(self, n, t1, t2, color, bgcolor, font):
 		'''
-		Helper function for self.updateTextFooter(). Prints two lines of text to screen in a given color.
+		Helper function for self.updateTextFooter(). Prints two lines of text to the footer surface in a given color.
 
 		:param n: The number of the panel in the footer counted from the left (determines position)
 		:param t1: First line of the text to be rendered
@@ -1073,10 +1230,10 @@ class Player(object):
 		:param font: The font object that shall be rendered
 		'''
 
-		s = pygame.Surface((self.displayFooterWidth, self.displayFooterHeight)).convert()
+		s = self.footerElements[n]
 		s.fill(bgcolor)
-		text1 = font.render(t1, True, color)
-		text2 = font.render(t2, True, color)
+		text1 = self.renderText(t1, color, font)
+		text2 = self.renderText(t2, color, font)
 
 		textPos1 = text1.get_rect()
 		textPos2 = text2.get_rect()
@@ -1091,21 +1248,23 @@ class Player(object):
 		textPos2.top = textPos1.height
 		s.blit(text2, textPos2)
 
-		sPos.top = self.displayPanelHeight
 		sPos.left = n * self.displayFooterWidth
 
-		self.background.blit(s, sPos)
+		self.textFooter.blit(s, sPos)
 
 
-	def updateTextFooter(self, update = True):
+	def updateTextFooter(self):
 		'''
-		Update the footer
-
-		:param update: Boolean to state, whether the display should be updated
+		Update the footer. The footer is only drawn again and marked as dirty, if its content has changed.
 		'''
 
+		state = (self.allowMusic, self.allowSounds, self.paused, self.allowCustomColors, self.debug, tuple(self.colorText), tuple(self.colorBackground))
+
+		# Nothing to do, if the panel still shows the current state
+		if not self._panelChanged('footer', state):
+			return
+
 		self.textFooter.fill(self.colorBackground)
-		r = self.background.blit(self.textFooter, (0, self.displayPanelHeight))
 
 		if self.allowMusic:
 			self.showFooterElement(0, 'F1', 'allow music', self.colorText, self.colorBackground, self.standardFont)
@@ -1134,10 +1293,8 @@ class Player(object):
 
 		self.showFooterElement(5, 'Escape', 'quit', self.colorText, self.colorBackground, self.standardFont)
 
-		self.screen.blit(self.background, (0, 0))
-
-		if update:
-			pygame.display.update(r)
+		r = self.screen.blit(self.textFooter, (0, self.displayPanelHeight))
+		self.dirtyRects['footer'] = r
 
 
 	def playMusic(self, previous = False):
@@ -1188,8 +1345,7 @@ class Player(object):
 		if self.globalEffects[effectID].interrupting:
 			self.interruptingGlobalEffect = True
 			pygame.mixer.music.pause()
-			for name, channel in self.activeChannels:
-				channel.pause()
+			pygame.mixer.pause()	# Pauses all channels at once. The reserved global channel is unpaused again, when the global effect is played on it.
 
 		self.activeGlobalEffect = effectID
 		self.globalChannel.play(self.globalEffects[effectID].obj)
@@ -1228,23 +1384,9 @@ class Player(object):
 
 	def playSound(self):
 		'''
-		Plays a random sound and adds its channel to the activeChannels list.
+		Plays a random sound and adds its channel and name to the activeChannels and activeChannelNames lists.
 		'''
 
-		def findSound(a, x):
-			'''
-			Find leftmost value greater than x using bisect
-
-			:param a: A sorted list with elements
-			:param x: The element to look for
-			:returns: The index of the leftmost element greater than x or None, if x is greater than the rightmost element
-			'''
-
-			i = bisect.bisect_right(a, x)
-			if i != len(a):
-				return i
-			return None
-
 		# If sounds are not allowed, update the now playing panel and do nothing more
 		if not self.allowSounds:
 			self.updateTextNowPlaying()
@@ -1252,19 +1394,52 @@ class Player(object):
 
 		if not self.paused and not self.activeGlobalEffect and self.activeSounds and pygame.mixer.find_channel() is not None:
 			rand = random.random()
-			if rand < self.occurences[-1]:
-				i = findSound(self.occurences, rand)
-				if i is not None and self.activeSounds[i].filename not in self.blockedSounds:
-					newSound = self.activeSounds[i]
+			if rand < self.maxOccurence:
+				# The sound at the index of the leftmost occurence greater than rand. As rand is smaller than the last occurence, the index is always valid.
+				newSound = self.activeSounds[bisect.bisect_right(self.occurences, rand)]
+				if newSound.filename not in self.blockedSounds:
 					self.debugPrint('Now playing sound {} with volume {}'.format(newSound.filename, newSound.volume))
-					self.activeChannels.append((newSound.name, newSound.obj.play()))
-					self.blockedSounds[newSound.filename] = newSound.obj.get_length() + newSound.cooldown
+					self.activeChannels.append(newSound.obj.play())
+					self.activeChannelNames.append(newSound.name)
+					self._blockSound(newSound.filename, newSound.length + newSound.cooldown)
 		self.updateTextNowPlaying()
 
 
+	def _blockSound(self, filename, duration):
+		'''
+		Blocks a sound, such that it is not played again for the given time. If the sound is already blocked, the new time replaces the old one.
+
+		:param filename: The filename of the sound to block
+		:param duration: Float with the time in seconds until the sound may be played again
+		'''
+
+		timeToStartAgain = pygame.time.get_ticks() + int(1000 * duration)
+		oldTime = self.blockedSounds.get(filename)
+		self.blockedSounds[filename] = timeToStartAgain
+		# If the sound is already blocked until an earlier time, the heap entry for that time is moved on in _unblockSounds(). So, the heap does not grow with each call
+		if oldTime is None or timeToStartAgain < oldTime:
+			heapq.heappush(self.blockedQueue, (timeToStartAgain, filename))
+
+
+	def _unblockSounds(self):
+		'''
+		Unblocks all sounds whose time is over. As the heap has the earliest time first, only the sounds that are unblocked are looked at.
+		'''
+
+		now = pygame.time.get_ticks()
+		while self.blockedQueue and self.blockedQueue[0][0] <= now:
+			timeToStartAgain, filename = heapq.heappop(self.blockedQueue)
+			currentTime = self.blockedSounds.get(filename)
+			if currentTime == timeToStartAgain:
+				del self.blockedSounds[filename]
+			# The sound was blocked again with a later time -> keep it blocked and queue the later time instead
+			elif currentTime is not None and currentTime > timeToStartAgain:
+				heapq.heappush(self.blockedQueue, (currentTime, filename))
+
+
 	def activateNewTheme(self, themeID):
 		'''
-		Activates a new theme. All sounds of that theme are loaded and their volumes adjusted. A new playlist is initiated with all songs. All running sounds are stopped and new music is played.
+		Activates a new theme. The sounds of that theme are already loaded by initializeThemeSounds(). A new playlist is initiated with all songs. All running sounds are stopped and new music is played.
 
 		:param themeID: The ID of the theme to activate
 		'''
@@ -1281,30 +1456,28 @@ class Player(object):
 			self.colorEmph = self.activeTheme.colorEmph
 			self.colorFade = self.activeTheme.colorFade
 
-		loopedSounds = []
-
-		# Get sounds and load them into pygame
-		self.activeSounds = copy.deepcopy(self.activeTheme.sounds)
-		for i in range(len(self.activeSounds)):
-			self.activeSounds[i].obj = pygame.mixer.Sound(self.activeSounds[i].filename)
-			self.activeSounds[i].obj.set_volume(self.activeSounds[i].volume)
-			if self.activeSounds[i].loop:
-				loopedSounds.append(i)
+		# Get sounds (they are already loaded into pygame and their volume is set)
+		self.activeSounds = self.activeTheme.sounds
+		loopedSounds = [sound for sound in self.activeSounds if sound.loop]
 
 		self.playlist = Playlist(self.activeTheme.songs)
 
 		self.occurences = self.activeTheme.occurences
+		if self.occurences:
+			self.maxOccurence = self.occurences[-1]
+		else:
+			self.maxOccurence = 0
 
-		# Push a SONG_END event on the event stack to trigger the start of a new song (causes a delay of one cycle, but that should be fine)
-		pygame.event.post(pygame.event.Event(self.SONG_END))
+		# Start the first song of the new playlist
+		self.playMusic()
 
 		pygame.mixer.stop()	# Stop all playing sounds
 
 		# Start all sounds that shall be looped
-		for i in loopedSounds:
-			newSound = self.activeSounds[i]
-			self.activeChannels.append(('>> ' + newSound.name, newSound.obj.play(loops = -1)))
-			self.blockedSounds[newSound.filename] = 604800 # one week
+		for newSound in loopedSounds:
+			self.activeChannels.append(newSound.obj.play(loops = -1))
+			self.activeChannelNames.append('>> ' + newSound.name)
+			self._blockSound(newSound.filename, 604800) # one week
 
 		self.updateTextAll()
 
@@ -1326,11 +1499,12 @@ class Player(object):
 			self.colorEmph = self.box.colorEmph
 			self.colorFade = self.box.colorFade
 
-		for name, channel in self.activeChannels:
+		for channel in self.activeChannels:
 			channel.stop()
 
 		self.activeSounds = []
 		self.occurences = []
+		self.maxOccurence = 0
 		self.playlist = Playlist([])
 
 		#pygame.mixer.stop()	# Stop all playing sounds
@@ -1344,17 +1518,20 @@ class Player(object):
 		Starts the main loop, that takes care of events (e.g. key strokes) and triggers random sounds.
 		'''
 
-		# remove clutter from the event queue
-		pygame.event.set_allowed(None)
-		pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, self.SONG_END, self.GLOBAL_END])
+		# Show the panels drawn so far. Otherwise, they would only appear with the first event
+		self.updateDisplay()
+
+		# Sound effects can be triggered about every second
+		pygame.time.set_timer(self.SOUND_TICK, 1000)
 
 		# Start main loop
 		while True:
-			# Max 10 fps (More would be overkill, I think)
-			self.clock.tick(10)
+			# Sleep until an event arrives. Then handle all waiting events at once
+			events = [pygame.event.wait()]
+			events.extend(pygame.event.get(self.allowedEvents))
 
 			# Let's see, what's in the event queue :)
-			for event in pygame.event.get():
+			for event in events:
 
 				# The program was quit (e.g. by clicking the X-button in the window title) -> quit and return
 				if event.type == pygame.QUIT:
@@ -1364,59 +1541,33 @@ class Player(object):
 				# At least one key was pressed
 				if event.type == pygame.KEYDOWN:
 
-					# Pre-processing: Map numpad keys to normal numbers
-					if 256 <= event.key <= 265:
-						event.key -= 208
-
+					# Pre-processing: Map numpad keys to normal numbers (the event itself is not changed)
+					key = self.numpadKeys.get(event.key, event.key)
 
 					# The Escape key was pressed -> quit and return
-					if event.key == pygame.K_ESCAPE:
+					if key == pygame.K_ESCAPE:
 						pygame.quit()
 						return
 
-					# The space key was pressed -> (un)pause everything
-					elif event.key == pygame.K_SPACE:
-						self.togglePause()
-
-					# The "->" key was pressed -> next song
-					elif event.key == pygame.K_RIGHT:
-						self.playMusic()
-
-					# The "<-" key was pressed -> previous song
-					elif event.key == pygame.K_LEFT:
-						self.playMusic(previous = True)
-
-					# The F1 key was pressed -> (dis)allow Music
-					elif event.key == pygame.K_F1:
-						self.toggleAllowMusic()
-
-					# The F2 key was pressed -> (dis)allow Sounds
-					elif event.key == pygame.K_F2:
-						self.toggleAllowSounds()
-
-					# The F5 key was pressed -> (dis)allow custom colors
-					elif event.key == pygame.K_F5:
-						self.toggleAllowCustomColors()
-
-					# The F10 key was pressed -> do (not) print debug info to stdout
-					elif event.key == pygame.K_F10:
-						self.toggleDebugOutput()
+					# The key always does the same thing (see self.keyActions) -> do it
+					elif key in self.keyActions:
+						self.keyActions[key]()
 
 					# The key is the key of the active theme -> deactivate theme (become silent)
-					elif event.key == self.activeThemeID:
+					elif key == self.activeThemeID:
 						self.deactivateTheme()
 
 					# The key is the key of the active global effect -> stop it
-					elif event.key == self.activeGlobalEffect:
+					elif key == self.activeGlobalEffect:
 						self.stopGlobalEffect()
 
 					# The key is one of the theme keys -> activate the theme
-					elif event.key in self.themeIDs:
-						self.activateNewTheme(event.key)
+					elif key in self.themeIDs:
+						self.activateNewTheme(key)
 
 					# The key is one of the global keys -> trigger effect
-					elif event.key in self.globalIDs:
-						self.playGlobalEffect(event.key)
+					elif key in self.globalIDs:
+						self.playGlobalEffect(key)
 
 				# The last song is finished (or a new theme was loaded) -> start new song, if available
 				if event.type == self.SONG_END:
@@ -1426,14 +1577,13 @@ class Player(object):
 				if event.type == self.GLOBAL_END:
 					self.stopGlobalEffect(byEndEvent = True)
 
-			# Sound effects can be triggered every tenth cycle (about every second).
-			if self.cycle > 10:
-				self.cycle = 0
-				if self.blockedSounds:
-					for k in self.blockedSounds.keys():
-						self.blockedSounds[k] -= 1
-				self.playSound()
-			self.cycle += 1
+				# About one second passed -> sound effects can be triggered
+				if event.type == self.SOUND_TICK:
+					self._unblockSounds()
+					self.playSound()
+
+			# Show all changes of this cycle at once
+			self.updateDisplay()
 
 
 	# CLASS Player END